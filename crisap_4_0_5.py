@@ -4,30 +4,51 @@
 
 import os
 import sys
+import atexit
+import queue
 import subprocess
-import platform
 import shutil
+import sysconfig
 import logging
+import logging.handlers
 import time
-import traceback
-import json
-import hashlib
-import tempfile
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional, Union, Set
 
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # Python 3.7
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None  # Fall back to find_spec probes only
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            "crisap.log"
-        ))
-    ]
-)
+# Records are queued and written by a background listener so that console
+# and file I/O stay off the diagnostic code paths.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler(os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "crisap.log"
+    ))
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Keeps basicConfig from installing its default format here; the full line is
+# formatted once by the listener's handlers
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger("CRISAP")
 
 # Constants
@@ -35,6 +56,40 @@ APP_VERSION = "4.0.5"
 APP_TITLE = f"🚀 CRISAP {APP_VERSION} - AI-Powered Climate Risk Intelligence System"
 REQUIRED_PYTHON_VERSION = (3, 7)
 SETUP_TIMESTAMP = time.strftime("%Y%m%d_%H%M%S")
+_IS_WINDOWS = os.name == "nt"
+DISK_CHECK_TTL = 60  # Seconds a disk space result stays valid
+_SITE_PACKAGES = sysconfig.get_paths()["purelib"]
+
+# The interpreter version is fixed for the life of the process
+_PY_OK = sys.version_info >= REQUIRED_PYTHON_VERSION
+_PY_VER_STR = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+REQUIRED_DIRS = ("config", "data", "logs", "models", "exports", "cache", "temp")
+REQUIRED_API_KEYS = ("OPENAI_API_KEY", "SUPABASE_URL", "SUPABASE_KEY", "INFURA_PROJECT_ID")
+
+# Canonical PyPI names of every package CRISAP depends on
+REQUIRED_PACKAGES = frozenset({
+    "numpy", "pandas", "scipy", "scikit-learn", "xgboost", "joblib",
+    "tensorflow", "torch", "transformers", "geopandas",
+    "shapely", "rasterio", "fiona", "pyproj", "folium", "h3", "requests",
+    "beautifulsoup4", "matplotlib", "seaborn", "plotly", "dash", "streamlit",
+    "streamlit_folium", "reportlab", "python-docx", "xlsxwriter", "boto3",
+    "azure-storage-blob", "google-cloud-storage", "web3", "supabase",
+    "pyjwt", "openai", "nltk", "spacy", "langchain", "pycountry", "python-dotenv"
+})
+# Subset verified on every diagnostics run
+CRITICAL_PACKAGES = frozenset({
+    "numpy", "pandas", "streamlit", "openai", "supabase", "folium", "web3"
+})
+
+# Distributions whose import name differs from their (normalized) PyPI name
+PACKAGE_IMPORT_NAMES = {
+    "python_docx": "docx",
+    "scikit_learn": "sklearn",
+    "beautifulsoup4": "bs4",
+    "pyjwt": "jwt",
+    "python_dotenv": "dotenv",
+}
 
 # Console colors for better readability
 class Colors:
@@ -46,52 +101,133 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
-def color_print(text: str, color: str) -> None:
-    """Print colored text if terminal supports it."""
-    if sys.stdout.isatty():  # Only use colors when outputting to terminal
-        print(f"{color}{text}{Colors.ENDC}")
-    else:
-        print(text)
+# sys.stdout is None under pythonw and some service hosts
+_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+def _print_colored(text: str, color: str) -> None:
+    """Print text wrapped in the given color code."""
+    print(f"{color}{text}{Colors.ENDC}")
+
+def _print_plain(text: str, color: str) -> None:
+    """Print text without color codes."""
+    print(text)
+
+# Only use colors when outputting to terminal; resolved once at import
+color_print = _print_colored if _IS_TTY else _print_plain
+
+def _normalize_package_name(name: str) -> str:
+    """Normalize a distribution name for comparison."""
+    return name.lower().replace("-", "_")
+
+def _import_name(package: str) -> str:
+    """Return the top-level module name provided by a distribution."""
+    name = _normalize_package_name(package)
+    return PACKAGE_IMPORT_NAMES.get(name, name)
+
+def _is_package_installed(package: str, installed: Set[str]) -> bool:
+    """Check installed metadata, then try locating the module without executing it."""
+    return (
+        _normalize_package_name(package) in installed
+        or importlib.util.find_spec(_import_name(package)) is not None
+    )
+
+_BANNER_LINES = (
+    "╔═══════════════════════════════════════════════════════════╗",
+    f"║                      CRISAP {APP_VERSION}                         ║",
+    "║     AI-Powered Climate Risk Intelligence System           ║",
+    "╚═══════════════════════════════════════════════════════════╝",
+)
+_COLOR_BANNER = "\n" + "".join(
+    f"    {Colors.BLUE}{Colors.BOLD}{line}{Colors.ENDC}\n" for line in _BANNER_LINES
+) + "    "
+_PLAIN_BANNER = "\n" + "".join(f"    {line}\n" for line in _BANNER_LINES) + "    "
+BANNER = _COLOR_BANNER if _IS_TTY else _PLAIN_BANNER
 
 def print_banner() -> None:
     """Print the CRISAP banner."""
-    banner = f"""
-    {Colors.BLUE}{Colors.BOLD}╔═══════════════════════════════════════════════════════════╗{Colors.ENDC}
-    {Colors.BLUE}{Colors.BOLD}║                      CRISAP {APP_VERSION}                         ║{Colors.ENDC}
-    {Colors.BLUE}{Colors.BOLD}║     AI-Powered Climate Risk Intelligence System           ║{Colors.ENDC}
-    {Colors.BLUE}{Colors.BOLD}╚═══════════════════════════════════════════════════════════╝{Colors.ENDC}
-    """
-    print(banner)
+    if sys.stdout is not None:
+        sys.stdout.write(BANNER + "\n")
+        sys.stdout.flush()
 
 # 🔧 Self-Healing System Functions
 
 class SystemHealth:
     """System health monitoring and self-healing functionality."""
     
+    __slots__ = (
+        "base_path", "health_check_results", "_dir_paths",
+        "_env_cache", "_env_cache_stat", "_cache_key",
+        "_disk_check_ts", "_disk_check_result",
+    )
+    
     def __init__(self):
         self.base_path = os.path.dirname(os.path.abspath(__file__))
         self.health_check_results = {}
+        self._dir_paths = tuple(Path(self.base_path) / d for d in REQUIRED_DIRS)
+        self._env_cache = {}
+        self._env_cache_stat = None
+        self._cache_key = None
+        self._disk_check_ts = 0.0
+        self._disk_check_result = None
+        
+    def _diagnostics_cache_key(self) -> Tuple:
+        """Build a key that changes whenever the diagnosed state may have changed."""
+        env_path = os.path.join(self.base_path, ".env")
+        try:
+            env_mtime = os.stat(env_path).st_mtime_ns
+        except FileNotFoundError:
+            env_mtime = 0
+        try:
+            # pip installs add entries here, so this tracks dependency changes
+            site_mtime = os.stat(_SITE_PACKAGES).st_mtime_ns
+        except OSError:
+            site_mtime = 0
+        return (
+            os.stat(self.base_path).st_mtime_ns,
+            env_mtime,
+            site_mtime,
+            tuple(bool(os.environ.get(key)) for key in REQUIRED_API_KEYS),
+        )
+    
+    def invalidate(self) -> None:
+        """Discard cached diagnostics so the next run re-checks everything."""
+        self._cache_key = None
+        self._disk_check_result = None
         
     def run_self_diagnostics(self) -> Dict[str, bool]:
         """Run a comprehensive system diagnostics."""
+        # Reuse the previous results if nothing relevant has changed. Disk usage
+        # changes without touching any keyed path, so it is always re-checked
+        # (subject to its own DISK_CHECK_TTL).
+        cache_key = self._diagnostics_cache_key()
+        if self._cache_key is not None and self._cache_key == cache_key:
+            results = self.health_check_results
+            results["disk_space"] = self._check_disk_space()
+            results["overall"] = all(ok for name, ok in results.items() if name != "overall")
+            return results
+        
         logger.info("Running self-diagnostics...")
         
         # Check Python version
         python_version_ok = self._check_python_version()
         
-        # Check directory structure
-        directories_ok = self._check_directories()
-        
-        # Check dependencies
-        dependencies_ok = self._check_dependencies()
+        # Run the I/O-bound checks concurrently so their syscalls overlap
+        checks = (
+            ("directories", self._check_directories),
+            ("dependencies", self._check_dependencies),
+            ("api_keys", self._check_api_keys),
+            ("disk_space", self._check_disk_space),
+        )
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {name: executor.submit(check) for name, check in checks}
+            results = {name: future.result() for name, future in futures.items()}
         
-        # Check API keys
-        api_keys_ok = self._check_api_keys()
+        directories_ok = results["directories"]
+        dependencies_ok = results["dependencies"]
+        api_keys_ok = results["api_keys"]
+        disk_space_ok = results["disk_space"]
         
-        # Check disk space
-        disk_space_ok = self._check_disk_space()
-        
-        # Store results
+        # Store results once every check has completed
         self.health_check_results = {
             "python_version": python_version_ok,
             "directories": directories_ok,
@@ -100,143 +236,207 @@ class SystemHealth:
             "disk_space": disk_space_ok,
             "overall": all([python_version_ok, directories_ok, dependencies_ok, api_keys_ok, disk_space_ok])
         }
+        # Key on the state seen before the checks, so anything they change
+        # (directories, .env, installed packages) forces one more full run
+        self._cache_key = cache_key
         
         return self.health_check_results
     
     def _check_python_version(self) -> bool:
         """Check if the current Python version meets requirements."""
-        current_version = sys.version_info
-        meets_requirement = current_version >= REQUIRED_PYTHON_VERSION
-        
-        if meets_requirement:
-            logger.info(f"✓ Python version {current_version.major}.{current_version.minor}.{current_version.micro} detected (meets requirements)")
+        if _PY_OK:
+            logger.info("✓ Python version %s detected (meets requirements)", _PY_VER_STR)
         else:
-            logger.warning(f"✗ Python version {current_version.major}.{current_version.minor}.{current_version.micro} detected")
-            logger.warning(f"  Required: Python {REQUIRED_PYTHON_VERSION[0]}.{REQUIRED_PYTHON_VERSION[1]} or higher")
+            logger.warning("✗ Python version %s detected", _PY_VER_STR)
+            logger.warning("  Required: Python %d.%d or higher", REQUIRED_PYTHON_VERSION[0], REQUIRED_PYTHON_VERSION[1])
             
-        return meets_requirement
+        return _PY_OK
+    
+    def _scan_base_path(self) -> Dict[str, os.DirEntry]:
+        """List the base directory in one pass, keyed by entry name."""
+        try:
+            with os.scandir(self.base_path) as entries:
+                return {entry.name: entry for entry in entries}
+        except OSError as e:
+            logger.error("✗ Failed to scan base directory %s: %s", self.base_path, e)
+            return {}
     
     def _check_directories(self) -> bool:
         """Check if required directories exist and are writable."""
-        required_dirs = [
-            "config", "data", "logs", "models", "exports", "cache", "temp"
-        ]
-        
         all_ok = True
-        for dir_name in required_dirs:
-            dir_path = os.path.join(self.base_path, dir_name)
+        entries = self._scan_base_path()
+        for dir_path in self._dir_paths:
+            entry = entries.get(dir_path.name)
             
             # Check if directory exists, create if not
-            if not os.path.exists(dir_path):
+            if entry is None:
                 try:
-                    os.makedirs(dir_path, exist_ok=True)
-                    logger.info(f"✓ Created missing directory: {dir_path}")
+                    dir_path.mkdir(parents=True, exist_ok=True)
+                    logger.info("✓ Created missing directory: %s", dir_path)
                 except Exception as e:
-                    logger.error(f"✗ Failed to create directory {dir_path}: {str(e)}")
+                    logger.error("✗ Failed to create directory %s: %s", dir_path, e)
                     all_ok = False
                     continue
+            elif not entry.is_dir():
+                logger.error("✗ Path exists but is not a directory: %s", dir_path)
+                all_ok = False
+                continue
             
             # Check if directory is writable
             if not os.access(dir_path, os.W_OK):
-                logger.error(f"✗ Directory not writable: {dir_path}")
+                logger.error("✗ Directory not writable: %s", dir_path)
                 all_ok = False
         
         return all_ok
     
     def _check_dependencies(self) -> bool:
         """Check if all required dependencies are installed."""
-        required_packages = [
-            "numpy", "pandas", "streamlit", "openai", "supabase", "folium", "web3"
-        ]
-        
         all_ok = True
-        missing_packages = []
         
-        for package in required_packages:
-            try:
-                __import__(package)
-            except ImportError:
-                missing_packages.append(package)
-                all_ok = False
+        # Look packages up in installed metadata rather than importing them,
+        # falling back to locating the module without executing it
+        installed = self._installed_distributions()
+        missing_packages = sorted(
+            package for package in CRITICAL_PACKAGES
+            if not _is_package_installed(package, installed)
+        )
         
         if missing_packages:
-            logger.warning(f"Missing dependencies: {', '.join(missing_packages)}")
+            all_ok = False
+            logger.warning("Missing dependencies: %s", ', '.join(missing_packages))
             logger.info("Attempting to install missing dependencies...")
             
-            for package in missing_packages:
+            self._install_packages(missing_packages)
+        
+        return all_ok
+    
+    def _installed_distributions(self) -> Set[str]:
+        """Return the normalized names of all installed distributions."""
+        if importlib_metadata is None:
+            return set()
+        return {
+            _normalize_package_name(dist.metadata["Name"])
+            for dist in importlib_metadata.distributions()
+            if dist.metadata["Name"]
+        }
+    
+    def _install_packages(self, packages: List[str],
+                          installed_before: Optional[Set[str]] = None) -> List[str]:
+        """Install packages with a single pip call and return those that failed."""
+        pip_command = [
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input", "--prefer-binary"
+        ]
+        if installed_before is None:
+            installed_before = self._installed_distributions()
+        
+        try:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Installing %s...", ', '.join(packages))
+            subprocess.check_call(
+                pip_command + list(packages),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except subprocess.CalledProcessError:
+            # Retry one by one so a single bad package doesn't block the rest
+            logger.warning("Batch install failed, retrying packages individually...")
+            for package in packages:
                 try:
-                    logger.info(f"Installing {package}...")
                     subprocess.check_call(
-                        [sys.executable, "-m", "pip", "install", package],
+                        pip_command + [package],
                         stdout=subprocess.DEVNULL,
                         stderr=subprocess.DEVNULL
                     )
-                    logger.info(f"✓ Successfully installed {package}")
                 except subprocess.CalledProcessError:
-                    logger.error(f"✗ Failed to install {package}")
-                    all_ok = False
+                    pass
         
-        return all_ok
+        importlib.invalidate_caches()  # Let find_spec see freshly installed modules
+        installed_after = self._installed_distributions()
+        failed_packages = []
+        for package in packages:
+            if not _is_package_installed(package, installed_after):
+                logger.error("✗ Failed to install %s", package)
+                failed_packages.append(package)
+            elif _normalize_package_name(package) not in installed_before:
+                logger.info("✓ Successfully installed %s", package)
+        
+        return failed_packages
     
     def _check_api_keys(self) -> bool:
         """Check if required API keys are available."""
-        required_keys = [
-            "OPENAI_API_KEY", "SUPABASE_URL", "SUPABASE_KEY", "INFURA_PROJECT_ID"
-        ]
-        
         all_ok = True
-        missing_keys = []
         
         # Check environment variables
-        for key in required_keys:
-            if not os.environ.get(key):
-                missing_keys.append(key)
+        env_snapshot = dict(os.environ)
+        missing_keys = {key for key in REQUIRED_API_KEYS if not env_snapshot.get(key)}
         
         # If any keys are missing, check .env file
         if missing_keys:
             env_path = os.path.join(self.base_path, ".env")
-            if os.path.exists(env_path):
+            try:
+                env_stat = os.stat(env_path)
+            except FileNotFoundError:
+                env_stat = None
+            
+            if env_stat is not None:
                 logger.info("Found .env file, checking for missing keys...")
                 
-                # Read .env file
-                with open(env_path, "r") as f:
-                    env_content = f.read()
-                
-                # Check if each missing key is in the .env file
-                for key in missing_keys[:]:
-                    if f"{key}=" in env_content:
-                        missing_keys.remove(key)
+                # Parse .env file only when it changed and keep it for later config lookups
+                stat_key = (env_stat.st_mtime_ns, env_stat.st_size)
+                if stat_key != self._env_cache_stat:
+                    self._env_cache = self._parse_env_file(env_path)
+                    self._env_cache_stat = stat_key
+                missing_keys -= self._env_cache.keys()
             
             # If keys are still missing, create template .env file
             if missing_keys:
-                logger.warning(f"Missing API keys: {', '.join(missing_keys)}")
-                if not os.path.exists(env_path):
+                logger.warning("Missing API keys: %s", ', '.join(sorted(missing_keys)))
+                if env_stat is None:
                     self._create_env_template(env_path)
                 all_ok = False
         
         return all_ok
     
+    def _parse_env_file(self, env_path: str) -> Dict[str, str]:
+        """Parse KEY=VALUE lines of a .env file into a dict."""
+        env_vars = {}
+        # utf-8-sig strips the BOM some Windows editors write
+        for line in Path(env_path).read_text(encoding="utf-8-sig").splitlines():
+            line = line.strip()
+            if "=" not in line or line.startswith("#"):
+                continue
+            key, value = line.split("=", 1)
+            if key.startswith("export "):
+                key = key[len("export "):]
+            env_vars[key.strip()] = value.strip().strip("'\"")
+        return env_vars
+    
     def _check_disk_space(self) -> bool:
         """Check if there's enough disk space."""
         min_space_mb = 500  # Minimum 500 MB required
         
+        # Reuse a recent result instead of querying the filesystem again
+        now = time.monotonic()
+        if self._disk_check_result is not None and now - self._disk_check_ts < DISK_CHECK_TTL:
+            return self._disk_check_result
+        
         try:
-            if platform.system() == "Windows":
-                free_space = shutil.disk_usage(self.base_path).free
-            else:
-                stat = os.statvfs(self.base_path)
-                free_space = stat.f_frsize * stat.f_bavail
-            
+            free_space = shutil.disk_usage(self.base_path).free
             free_space_mb = free_space / (1024 * 1024)
             
             if free_space_mb < min_space_mb:
-                logger.warning(f"Low disk space: {free_space_mb:.2f} MB available, minimum {min_space_mb} MB required")
-                return False
+                logger.warning("Low disk space: %.2f MB available, minimum %d MB required", free_space_mb, min_space_mb)
+                result = False
             else:
-                logger.info(f"✓ Sufficient disk space: {free_space_mb:.2f} MB available")
-                return True
+                logger.info("✓ Sufficient disk space: %.2f MB available", free_space_mb)
+                result = True
+            
+            self._disk_check_ts = now
+            self._disk_check_result = result
+            return result
         except Exception as e:
-            logger.error(f"✗ Failed to check disk space: {str(e)}")
+            logger.error("✗ Failed to check disk space: %s", e)
             return False
     
     def _create_env_template(self, env_path: str) -> None:
@@ -268,12 +468,26 @@ TEMP_PATH={os.path.join(self.base_path, "temp")}
 JWT_SECRET=change_this_to_a_random_string
 """
         
+        import tempfile  # Only needed on this cold path
+        
+        # Write to a temp file in the same directory and rename it into place,
+        # so readers never see a partially written .env
+        tmp_path = None
         try:
-            with open(env_path, "w") as f:
+            fd, tmp_path = tempfile.mkstemp(prefix=".env.", dir=os.path.dirname(env_path))
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
                 f.write(template)
-            logger.info(f"✓ Created template .env file at {env_path}")
+            os.chmod(tmp_path, 0o600)  # Holds secrets: owner read/write only
+            os.replace(tmp_path, env_path)
+            tmp_path = None
+            logger.info("✓ Created template .env file at %s", env_path)
         except Exception as e:
-            logger.error(f"✗ Failed to create .env file: {str(e)}")
+            logger.error("✗ Failed to create .env file: %s", e)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
     
     def perform_self_healing(self) -> bool:
         """Attempt to fix any issues found during diagnostics."""
@@ -305,65 +519,81 @@ JWT_SECRET=change_this_to_a_random_string
             else:
                 failed_fixes.append("dependencies")
         
+        # Fixes mutate the environment, so cached diagnostics are stale
+        if fixed_issues or failed_fixes:
+            self.invalidate()
+        
         # Log results
         if fixed_issues:
-            logger.info(f"✓ Self-healing fixed: {', '.join(fixed_issues)}")
+            logger.info("✓ Self-healing fixed: %s", ', '.join(fixed_issues))
         if failed_fixes:
-            logger.warning(f"✗ Self-healing failed to fix: {', '.join(failed_fixes)}")
+            logger.warning("✗ Self-healing failed to fix: %s", ', '.join(failed_fixes))
         
         # Return True if all issues were fixed
         return len(failed_fixes) == 0
     
     def _fix_directories(self) -> bool:
         """Fix directory structure issues."""
-        required_dirs = [
-            "config", "data", "logs", "models", "exports", "cache", "temp"
-        ]
-        
         all_fixed = True
-        for dir_name in required_dirs:
-            dir_path = os.path.join(self.base_path, dir_name)
-            
-            # Create directory if it doesn't exist
-            if not os.path.exists(dir_path):
-                try:
-                    os.makedirs(dir_path, exist_ok=True)
-                    logger.info(f"✓ Created directory: {dir_path}")
-                except Exception as e:
-                    logger.error(f"✗ Failed to create directory {dir_path}: {str(e)}")
+        for dir_path in self._dir_paths:
+            # Create directory if it doesn't exist; mkdir itself reports EEXIST
+            try:
+                dir_path.mkdir(parents=True)
+                logger.info("✓ Created directory: %s", dir_path)
+                continue
+            except FileExistsError:
+                if not dir_path.is_dir():
+                    logger.error("✗ Path exists but is not a directory: %s", dir_path)
                     all_fixed = False
+                    continue
+            except Exception as e:
+                logger.error("✗ Failed to create directory %s: %s", dir_path, e)
+                all_fixed = False
+                continue
             
             # Fix permissions if directory is not writable
-            elif not os.access(dir_path, os.W_OK):
+            if not os.access(dir_path, os.W_OK):
                 try:
-                    if platform.system() != "Windows":
+                    if not _IS_WINDOWS:
                         os.chmod(dir_path, 0o755)  # rwxr-xr-x
-                        logger.info(f"✓ Fixed permissions for directory: {dir_path}")
+                        logger.info("✓ Fixed permissions for directory: %s", dir_path)
                     else:
-                        logger.warning(f"Cannot fix permissions on Windows for: {dir_path}")
+                        logger.warning("Cannot fix permissions on Windows for: %s", dir_path)
                         all_fixed = False
                 except Exception as e:
-                    logger.error(f"✗ Failed to fix permissions for {dir_path}: {str(e)}")
+                    logger.error("✗ Failed to fix permissions for %s: %s", dir_path, e)
                     all_fixed = False
         
         return all_fixed
     
     def _fix_dependencies(self) -> bool:
         """Fix dependency issues."""
-        required_packages = [
-            "numpy", "pandas", "scipy", "scikit-learn", "xgboost", "joblib",
-            "tensorflow", "torch", "transformers", "geopandas",
-            "shapely", "rasterio", "fiona", "pyproj", "folium", "h3", "requests",
-            "beautifulsoup4", "matplotlib", "seaborn", "plotly", "dash", "streamlit",
-            "streamlit_folium", "reportlab", "python-docx", "xlsxwriter", "boto3",
-            "azure-storage-blob", "google-cloud-storage", "web3", "supabase-py",
-            "pyjwt", "openai", "nltk", "spacy", "langchain", "pycountry", "python-dotenv"
-        ]
-        
         # Optional: Try to install climada, but don't fail if it doesn't work
-        try:
-            __import__("climada")
-        except ImportError:
+        if importlib.util.find_spec("climada") is None:
             try:
                 logger.info("Installing climada...")
-                subprocess
\ No newline at end of file
+                subprocess.check_call(
+                    [sys.executable, "-m", "pip", "install", "climada"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                logger.info("✓ Successfully installed climada")
+            except subprocess.CalledProcessError:
+                logger.warning("Could not install climada, continuing without it")
+        
+        # Only hand pip the packages that aren't already installed
+        installed = self._installed_distributions()
+        to_install = sorted(
+            package for package in REQUIRED_PACKAGES
+            if not _is_package_installed(package, installed)
+        )
+        if not to_install:
+            logger.info("✓ All required packages are already installed")
+            return True
+        
+        # Install the remaining packages in one pip run
+        failed_packages = self._install_packages(to_install, installed)
+        if failed_packages:
+            logger.error("✗ Failed to install: %s", ', '.join(failed_packages))
+        
+        return not failed_packages